@@ -2,25 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.exceptions import ConfigEntryNotReady
 
-from .api import EmlidAPIClient, EmlidWebSocketClient
+from .api import EmlidAPIClient, EmlidWebSocketClient, create_session
 from .const import CONF_HOST, CONF_UPDATE_RATE, DEFAULT_UPDATE_RATE, DOMAIN, PLATFORMS
 from .coordinator import EmlidDataUpdateCoordinator
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import Event, HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class EmlidData:
     """Dataclass for runtime data."""
 
@@ -42,41 +43,43 @@ async def async_setup_entry(
     host = config_entry.data[CONF_HOST]
     update_rate = config_entry.data.get(CONF_UPDATE_RATE, DEFAULT_UPDATE_RATE)
 
-    # Initialize API clients
+    # Initialize API clients (dedicated keep-alive session for this device)
     api_client = EmlidAPIClient(
         host=host,
-        session=async_get_clientsession(hass),
+        session=create_session(host),
     )
 
     ws_client = EmlidWebSocketClient(host=host)
 
-    # Validate connection by fetching device info
-    try:
-        info = await api_client.get_info()
-        device_info = info.get("device", {})
-        _LOGGER.debug(
-            "Connected to Emlid %s (SN: %s)",
-            device_info.get("model", "Unknown"),
-            device_info.get("serial_number", "Unknown"),
-        )
-    except Exception as err:
-        _LOGGER.error("Failed to connect to Emlid device: %s", err)
-        return False
-
     # Initialize coordinator
     coordinator = EmlidDataUpdateCoordinator(
         hass, config_entry, api_client, ws_client, update_rate
     )
 
-    # Connect WebSocket
-    try:
-        await ws_client.connect()
-    except Exception as err:
-        _LOGGER.error("Failed to connect WebSocket: %s", err)
-        return False
-
-    # Perform first data fetch
-    await coordinator.async_config_entry_first_refresh()
+    # Connect WebSocket and perform the first data fetch (which also validates
+    # the device via /info) concurrently
+    ws_result, refresh_result = await asyncio.gather(
+        ws_client.connect(),
+        coordinator.async_config_entry_first_refresh(),
+        return_exceptions=True,
+    )
+    if isinstance(ws_result, BaseException) or isinstance(refresh_result, BaseException):
+        await ws_client.disconnect()
+        await api_client.close()
+        if isinstance(refresh_result, ConfigEntryNotReady):
+            raise refresh_result
+        err = refresh_result if isinstance(refresh_result, BaseException) else ws_result
+        raise ConfigEntryNotReady(f"Failed to connect to Emlid device: {err}") from err
+
+    # The session is ours, not Home Assistant's: close it on unload and on
+    # shutdown, where config entries are not unloaded
+    async def _async_close_session(_event: Event) -> None:
+        await api_client.close()
+
+    config_entry.async_on_unload(api_client.close)
+    config_entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
 
     config_entry.runtime_data = EmlidData(
         coordinator=coordinator,
@@ -3,49 +3,113 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from typing import Any, Callable
+import random
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any, Callable, Final
 
+import orjson
 import socketio
-from aiohttp import ClientSession
-
-from .const import SOCKETIO_PATH, WEBSOCKET_RECONNECT_DELAY, WEBSOCKET_RECONNECT_DELAY_MAX
+from aiohttp import (
+    ClientError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    WSServerHandshakeError,
+)
+
+from .const import (
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_LIMIT_PER_HOST,
+    HTTP_MAX_CONCURRENT_REQUESTS,
+    SOCKETIO_PATH,
+    WEBSOCKET_COALESCE_WINDOW,
+    WEBSOCKET_ONLY,
+    WEBSOCKET_RECONNECT_DELAY,
+    WEBSOCKET_RECONNECT_DELAY_MAX,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_NO_CALLBACKS: tuple[Callable, ...] = ()
+
+REQUEST_TIMEOUT: Final = ClientTimeout(total=10)
+
+# Errors raised by a failed request or an unparseable response body
+REQUEST_ERRORS: Final = (ClientError, asyncio.TimeoutError, json.JSONDecodeError)
+
 
 class EmlidAPIError(Exception):
     """Base exception for Emlid API errors."""
 
 
+def _websocket_refused(err: BaseException | None) -> bool:
+    """Return whether the device answered but refused the websocket handshake.
+
+    python-socketio hides the aiohttp error behind its own ConnectionError,
+    so the implicit exception context is walked to find it.
+    """
+    while err is not None:
+        if isinstance(err, WSServerHandshakeError):
+            return True
+        err = err.__context__
+    return False
+
+
+def create_session(host: str) -> ClientSession:
+    """Create a keep-alive client session bound to a single Emlid host.
+
+    The caller owns the session and must close it.
+    """
+    connector = TCPConnector(
+        limit_per_host=HTTP_LIMIT_PER_HOST,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        force_close=False,
+    )
+    return ClientSession(connector=connector, base_url=f"http://{host}")
+
+
 class EmlidAPIClient:
     """Client for Emlid REST API."""
 
     def __init__(self, host: str, session: ClientSession) -> None:
-        """Initialize the API client."""
+        """Initialize the API client.
+
+        The session must be created with ``create_session`` so relative
+        endpoints resolve against the device.
+        """
         self.host = host
         self.session = session
-        self.base_url = f"http://{host}"
+        self._semaphore = asyncio.Semaphore(HTTP_MAX_CONCURRENT_REQUESTS)
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        await self.session.close()
 
     async def _get(self, endpoint: str) -> dict[str, Any]:
         """Make a GET request to the API."""
-        url = f"{self.base_url}{endpoint}"
         try:
-            async with self.session.get(url, timeout=10) as response:
+            async with (
+                self._semaphore,
+                self.session.get(endpoint, timeout=REQUEST_TIMEOUT) as response,
+            ):
                 response.raise_for_status()
-                return await response.json()
-        except Exception as err:
+                return await response.json(loads=orjson.loads)
+        except REQUEST_ERRORS as err:
             _LOGGER.error("Error fetching %s: %s", endpoint, err)
             raise EmlidAPIError(f"Failed to fetch {endpoint}") from err
 
     async def _post(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
         """Make a POST request to the API."""
-        url = f"{self.base_url}{endpoint}"
         try:
-            async with self.session.post(url, json=data, timeout=10) as response:
+            async with self.session.post(endpoint, json=data, timeout=REQUEST_TIMEOUT) as response:
                 response.raise_for_status()
-                return await response.json()
-        except Exception as err:
+                return await response.json(loads=orjson.loads)
+        except REQUEST_ERRORS as err:
             _LOGGER.error("Error posting to %s: %s", endpoint, err)
             raise EmlidAPIError(f"Failed to post to {endpoint}") from err
 
@@ -77,6 +141,31 @@ class EmlidAPIClient:
         """Get LoRa RSSI."""
         return await self._get("/lora/rssi")
 
+    async def get_all(self, endpoints: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Fetch several endpoints concurrently.
+
+        Returns a dict keyed by endpoint. Endpoints that fail (already logged
+        by ``_get``) are left out, so one slow or broken endpoint does not
+        fail the whole batch.
+        """
+        endpoints = tuple(endpoints)
+        results = await asyncio.gather(
+            *(self._get(endpoint) for endpoint in endpoints),
+            return_exceptions=True,
+        )
+
+        data: dict[str, dict[str, Any]] = {}
+        for endpoint, result in zip(endpoints, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                continue
+            data[endpoint] = result
+
+        if not data:
+            raise EmlidAPIError("Failed to fetch any endpoint")
+        return data
+
     async def get_device_config(self) -> dict[str, Any]:
         """Get device configuration."""
         config = await self.get_configuration()
@@ -132,24 +221,60 @@ class EmlidWebSocketClient:
         self.host = host
         self.url = f"http://{host}"
         self.sio: socketio.AsyncClient | None = None
-        self._callbacks: dict[str, list[Callable]] = {}
+        self._callbacks: defaultdict[str, list[Callable]] = defaultdict(list)
+        # Immutable snapshot of _callbacks used on the per-message dispatch path
+        self._dispatch: dict[str, tuple[Callable, ...]] = {}
         self._connected = False
         self._connect_lock = asyncio.Lock()
+        self._closing = False
+        self._reconnect_task: asyncio.Task | None = None
+        # Latest payload per event, delivered once per coalescing window
+        self._pending: dict[str, Any] = {}
+        self._flush_task: asyncio.Task | None = None
 
     def on(self, event: str, callback: Callable) -> None:
         """Register a callback for a specific event."""
-        if event not in self._callbacks:
-            self._callbacks[event] = []
         self._callbacks[event].append(callback)
+        self._dispatch[event] = tuple(self._callbacks[event])
 
     def _emit_callback(self, event: str, data: Any) -> None:
         """Emit callbacks for an event."""
-        if event in self._callbacks:
-            for callback in self._callbacks[event]:
-                try:
-                    callback(data)
-                except Exception as err:
-                    _LOGGER.error("Error in callback for %s: %s", event, err)
+        for callback in self._dispatch.get(event, _NO_CALLBACKS):
+            try:
+                callback(data)
+            except Exception as err:
+                _LOGGER.error("Error in callback for %s: %s", event, err)
+
+    async def _on_sio_connect(self) -> None:
+        """Handle connection event."""
+        _LOGGER.info("WebSocket connected to %s", self.host)
+        self._connected = True
+
+    async def _on_sio_disconnect(self) -> None:
+        """Handle disconnection event."""
+        _LOGGER.warning("WebSocket disconnected from %s", self.host)
+        self._connected = False
+        if not self._closing and self._reconnect_task is None:
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _on_broadcast(self, data: Any) -> None:
+        """Handle broadcast events from device."""
+        if isinstance(data, dict) and "name" in data and "payload" in data:
+            event_name = data["name"]
+            payload = data["payload"]
+            self._pending[event_name] = payload
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(
+                    self._flush_after(WEBSOCKET_COALESCE_WINDOW)
+                )
+
+    async def _flush_after(self, delay: float) -> None:
+        """Emit the pending payloads once the coalescing window has passed."""
+        await asyncio.sleep(delay)
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+        for event, payload in pending.items():
+            self._emit_callback(event, payload)
 
     async def connect(self) -> None:
         """Connect to the WebSocket."""
@@ -157,48 +282,93 @@ class EmlidWebSocketClient:
             if self._connected:
                 return
 
+            self._closing = False
+            # Reconnection is handled by _reconnect: the library only adds
+            # +/-0.5 s of jitter, which does not spread out a reconnect storm.
+            # No json= codec: python-socketio 4.x installs it on the shared
+            # Packet classes, i.e. for every Socket.IO client in the process.
             self.sio = socketio.AsyncClient(
                 logger=False,
                 engineio_logger=False,
-                reconnection=True,
-                reconnection_delay=WEBSOCKET_RECONNECT_DELAY,
-                reconnection_delay_max=WEBSOCKET_RECONNECT_DELAY_MAX,
+                reconnection=False,
             )
 
-            @self.sio.event
-            async def connect():
-                """Handle connection event."""
-                _LOGGER.info("WebSocket connected to %s", self.host)
-                self._connected = True
-
-            @self.sio.event
-            async def disconnect():
-                """Handle disconnection event."""
-                _LOGGER.warning("WebSocket disconnected from %s", self.host)
-                self._connected = False
-
-            @self.sio.on("broadcast")
-            async def on_broadcast(data):
-                """Handle broadcast events from device."""
-                if isinstance(data, dict) and "name" in data and "payload" in data:
-                    event_name = data["name"]
-                    payload = data["payload"]
-                    self._emit_callback(event_name, payload)
+            self.sio.on("connect", self._on_sio_connect, namespace="/")
+            self.sio.on("disconnect", self._on_sio_disconnect, namespace="/")
+            self.sio.on("broadcast", self._on_broadcast, namespace="/")
 
             try:
-                await self.sio.connect(
-                    self.url,
-                    socketio_path=SOCKETIO_PATH,
-                    transports=["polling", "websocket"],
-                    namespaces=["/"],
-                )
-                _LOGGER.debug("WebSocket client initialized for %s", self.host)
+                await self._connect_sio()
             except Exception as err:
                 _LOGGER.error("Failed to connect WebSocket to %s: %s", self.host, err)
                 raise EmlidAPIError("Failed to connect WebSocket") from err
+            _LOGGER.debug("WebSocket client initialized for %s", self.host)
+
+    async def _connect_sio(self) -> None:
+        """Open the Socket.IO connection, preferring the websocket transport.
+
+        Long-polling is only tried when the device refuses the websocket
+        handshake; an unreachable device fails on the first attempt.
+        """
+        if WEBSOCKET_ONLY:
+            try:
+                await self._sio_connect(["websocket"])
+            except Exception as err:
+                if not _websocket_refused(err):
+                    raise
+                _LOGGER.debug(
+                    "WebSocket transport refused by %s, falling back to polling",
+                    self.host,
+                )
+            else:
+                return
+        await self._sio_connect(["polling", "websocket"])
+
+    async def _sio_connect(self, transports: list[str]) -> None:
+        """Connect the Socket.IO client using the given transports."""
+        await self.sio.connect(
+            self.url,
+            socketio_path=SOCKETIO_PATH,
+            transports=transports,
+            namespaces=["/"],
+        )
+
+    async def _reconnect(self) -> None:
+        """Reconnect after a dropped connection using jittered backoff."""
+        attempt = 0
+        delay = WEBSOCKET_RECONNECT_DELAY
+        try:
+            while not self._closing and not self._connected:
+                await asyncio.sleep(delay * (0.5 + random.random() * 0.5))
+                # Doubled in place, so it stops growing once capped
+                delay = min(WEBSOCKET_RECONNECT_DELAY_MAX, delay * 2)
+                attempt += 1
+                if self._closing:
+                    break
+                try:
+                    await self._connect_sio()
+                except Exception as err:
+                    _LOGGER.debug(
+                        "WebSocket reconnect attempt %d to %s failed: %s",
+                        attempt,
+                        self.host,
+                        err,
+                    )
+                else:
+                    return
+        finally:
+            self._reconnect_task = None
 
     async def disconnect(self) -> None:
         """Disconnect from the WebSocket."""
+        self._closing = True
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._pending = {}
         if self.sio and self._connected:
             await self.sio.disconnect()
             self._connected = False
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -17,8 +17,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import EmlidConfigEntry
-from .const import DOMAIN, MANUFACTURER
-from .coordinator import EmlidDataUpdateCoordinator
+from .coordinator import EmlidDataUpdateCoordinator, deep_get
 
 if TYPE_CHECKING:
     pass
@@ -28,10 +27,23 @@ _LOGGER = logging.getLogger(__name__)
 
 @dataclass(frozen=True, kw_only=True)
 class EmlidBinarySensorEntityDescription(BinarySensorEntityDescription):
-    """Describes Emlid binary sensor entity."""
+    """Describes Emlid binary sensor entity.
 
-    value_fn: Callable[[dict[str, Any]], bool | None]
-    available_fn: Callable[[dict[str, Any]], bool] = lambda data: True
+    ``path`` locates the value in the coordinator data; the entity is available
+    while the first key of the path is present. ``value_fn`` overrides the
+    lookup for values derived from more than one field.
+    """
+
+    path: tuple[str, ...]
+    value_fn: Callable[[dict[str, Any]], bool | None] | None = None
+
+
+def _wifi_connected(data: dict[str, Any]) -> bool:
+    """Return whether WiFi is enabled and joined to a network."""
+    return (
+        bool(deep_get(data, ("wifi_status", "enabled")))
+        and deep_get(data, ("wifi_status", "current_network")) is not None
+    )
 
 
 BINARY_SENSOR_DESCRIPTIONS: tuple[EmlidBinarySensorEntityDescription, ...] = (
@@ -40,35 +52,29 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[EmlidBinarySensorEntityDescription, ...] = (
         translation_key="lora_connected",
         name="LoRa Connected",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        value_fn=lambda data: data.get("lora_connected"),
-        available_fn=lambda data: "lora_connected" in data,
+        path=("lora_connected",),
     ),
     EmlidBinarySensorEntityDescription(
         key="usb_power",
         translation_key="usb_power",
         name="USB Power",
         device_class=BinarySensorDeviceClass.PLUG,
-        value_fn=lambda data: data.get("power_usb_connected"),
-        available_fn=lambda data: "power_usb_connected" in data,
+        path=("power_usb_connected",),
     ),
     EmlidBinarySensorEntityDescription(
         key="battery_present",
         translation_key="battery_present",
         name="Battery Present",
         device_class=BinarySensorDeviceClass.BATTERY,
-        value_fn=lambda data: data.get("power_battery_present"),
-        available_fn=lambda data: "power_battery_present" in data,
+        path=("power_battery_present",),
     ),
     EmlidBinarySensorEntityDescription(
         key="wifi_connected",
         translation_key="wifi_connected",
         name="WiFi Connected",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        value_fn=lambda data: (
-            data.get("wifi_status", {}).get("enabled", False)
-            and data.get("wifi_status", {}).get("current_network") is not None
-        ),
-        available_fn=lambda data: "wifi_status" in data,
+        path=("wifi_status",),
+        value_fn=_wifi_connected,
     ),
     EmlidBinarySensorEntityDescription(
         key="bluetooth_enabled",
@@ -76,8 +82,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[EmlidBinarySensorEntityDescription, ...] = (
         name="Bluetooth Enabled",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: data.get("bluetooth_status", {}).get("enabled"),
-        available_fn=lambda data: "bluetooth_status" in data,
+        path=("bluetooth_status", "enabled"),
     ),
     EmlidBinarySensorEntityDescription(
         key="logging_active",
@@ -85,11 +90,14 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[EmlidBinarySensorEntityDescription, ...] = (
         name="Data Logging",
         icon="mdi:database",
         entity_registry_enabled_default=False,
-        value_fn=lambda data: data.get("logging_active"),
-        available_fn=lambda data: "logging_active" in data,
+        path=("logging_active",),
     ),
 )
 
+BINARY_SENSOR_DESCRIPTIONS_BY_KEY: Final = {
+    description.key: description for description in BINARY_SENSOR_DESCRIPTIONS
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -99,12 +107,10 @@ async def async_setup_entry(
     """Set up Emlid binary sensors from a config entry."""
     coordinator = config_entry.runtime_data.coordinator
 
-    entities = [
+    async_add_entities(
         EmlidBinarySensor(coordinator, description, config_entry)
         for description in BINARY_SENSOR_DESCRIPTIONS
-    ]
-
-    async_add_entities(entities)
+    )
 
 
 class EmlidBinarySensor(
@@ -125,30 +131,20 @@ class EmlidBinarySensor(
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{config_entry.entry_id}_{description.key}"
-
-        # Device info
-        device_info = coordinator.data.get("device_info", {}).get("device", {})
-        serial_number = device_info.get("serial_number", config_entry.entry_id)
-        model = device_info.get("model", "Reach RS4")
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, serial_number)},
-            "name": "Emlid",
-            "manufacturer": MANUFACTURER,
-            "model": model,
-            "serial_number": serial_number,
-            "sw_version": device_info.get("app_version"),
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        return self.entity_description.value_fn(self.coordinator.data)
+        description = self.entity_description
+        if description.value_fn is not None:
+            return description.value_fn(self.coordinator.data)
+        return deep_get(self.coordinator.data, description.path)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.entity_description.available_fn(self.coordinator.data)
+            and self.entity_description.path[0] in self.coordinator.data
         )
@@ -7,9 +7,8 @@ from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import EmlidAPIClient, EmlidAPIError
+from .api import EmlidAPIClient, EmlidAPIError, create_session
 from .const import (
     CONF_HOST,
     CONF_UPDATE_RATE,
@@ -39,12 +38,11 @@ class EmlidConfigFlow(ConfigFlow, domain=DOMAIN):
 
     async def validate_config(self) -> None:
         """Validate the host connection."""
-        api_client = EmlidAPIClient(
-            host=self.data[CONF_HOST],
-            session=async_get_clientsession(self.hass),
-        )
+        host = self.data[CONF_HOST]
         try:
-            info = await api_client.get_info()
+            async with create_session(host) as session:
+                api_client = EmlidAPIClient(host=host, session=session)
+                info = await api_client.get_info()
             device_info = info.get("device", {})
             self.serial_number = device_info.get("serial_number", "Unknown")
             model = device_info.get("model", "Unknown")
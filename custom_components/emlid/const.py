@@ -7,14 +7,14 @@ from typing import Final
 from homeassistant.const import Platform
 
 DOMAIN: Final = "emlid"
-PLATFORMS = [
+PLATFORMS: Final = (
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
     Platform.DEVICE_TRACKER,
     Platform.SWITCH,
     Platform.NUMBER,
     Platform.SELECT,
-]
+)
 
 # Configuration
 CONF_HOST: Final = "host"
@@ -29,10 +29,24 @@ MAX_UPDATE_RATE: Final = 10.0  # Hz
 # Default 30 seconds is fine for configuration data
 REST_UPDATE_INTERVAL: Final = 30
 
+# REST connection pool (single host, kept alive between polls)
+HTTP_LIMIT_PER_HOST: Final = 8
+HTTP_DNS_CACHE_TTL: Final = 300  # seconds
+HTTP_KEEPALIVE_TIMEOUT: Final = 75  # seconds
+# Concurrent GETs allowed in flight; the device's web server queues beyond this
+HTTP_MAX_CONCURRENT_REQUESTS: Final = 3
+
 # WebSocket connection
 SOCKETIO_PATH: Final = "/socket.io"
+# Open the WebSocket transport directly instead of upgrading from long-polling.
+# Falls back to polling + upgrade if the device refuses the direct connection.
+WEBSOCKET_ONLY: Final = True
+# Broadcasts arriving within this window (seconds) are coalesced, keeping only
+# the latest payload per event name
+WEBSOCKET_COALESCE_WINDOW: Final = 0.05
+# Reconnect backoff: base * 2**attempt, capped, then jittered to 50-100%
 WEBSOCKET_RECONNECT_DELAY: Final = 1
-WEBSOCKET_RECONNECT_DELAY_MAX: Final = 5
+WEBSOCKET_RECONNECT_DELAY_MAX: Final = 30
 
 # Device info
 MANUFACTURER: Final = "Emlid"
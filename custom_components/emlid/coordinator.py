@@ -2,23 +2,90 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, TypedDict
-
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any, Final, TypedDict
+
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
 
 from .api import EmlidAPIClient, EmlidAPIError, EmlidWebSocketClient
-from .const import DOMAIN, REST_UPDATE_INTERVAL
+from .const import DOMAIN, MANUFACTURER, REST_UPDATE_INTERVAL
 
 if TYPE_CHECKING:
+    import asyncio
+
     from homeassistant.core import HomeAssistant
 
     from . import EmlidConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
+# REST endpoints polled by the coordinator, mapped to their data keys
+REST_ENDPOINTS: Final = {
+    "/info": "device_info",
+    "/configuration": "configuration",
+    "/wifi/status": "wifi_status",
+    "/bluetooth/status": "bluetooth_status",
+    "/lora/rssi": "lora_rssi",
+}
+
+# Satellite index prefix (e.g. "G05") to constellation name
+CONSTELLATION_PREFIXES: Final = {
+    "G": "GPS",
+    "R": "GLONASS",
+    "E": "Galileo",
+    "C": "BeiDou",
+    "J": "QZSS",
+    "S": "SBAS",
+}
+
+# Log types reported by the active_logs event
+LOG_TYPES: Final = ("raw", "solution", "base")
+
+# Constellation groups for an observation without satellites; shared, so
+# treat as read-only
+EMPTY_CONSTELLATIONS: Final = {name: () for name in CONSTELLATION_PREFIXES.values()}
+
+
+def deep_get(data: Any, path: tuple[str, ...], default: Any = None) -> Any:
+    """Return the value at ``path`` in nested dicts.
+
+    Returns ``default`` if a key is missing, an intermediate value is not a
+    dict, or the value itself is None. No throwaway ``{}`` defaults are built
+    along the way.
+    """
+    for key in path:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+    return default if data is None else data
+
+
+def path_getter(*path: str) -> Callable[[dict[str, Any]], Any]:
+    """Return a ``value_fn`` that reads ``path`` from the coordinator data."""
+    return partial(deep_get, path=path)
+
+
+def always_available(data: dict[str, Any]) -> bool:
+    """Default ``available_fn``: available whenever the coordinator is."""
+    return True
+
+
+def config_available(data: dict[str, Any]) -> bool:
+    """Return whether the device configuration has been fetched."""
+    return "configuration" in data
+
 
 class NavigationData(TypedDict, total=False):
     """Type for navigation data."""
@@ -97,15 +164,24 @@ class EmlidDataUpdateCoordinator(DataUpdateCoordinator[EmlidCoordinatorData]):
         self.api_client = api_client
         self.ws_client = ws_client
         self.update_rate = update_rate
-        self._throttle_interval = timedelta(seconds=1.0 / update_rate)
-        self._last_update: dict[str, datetime] = {}
+        self._throttle_seconds = 1.0 / update_rate
+        # Monotonic timestamps of the last accepted update per throttle key
+        self._last_update: dict[str, float] = {}
+
+        # Device info shared by every entity, filled in on the first refresh
+        self.device_info: DeviceInfo = self._build_device_info({})
 
-        # Current data (updated by WebSocket)
+        # Current data (updated by WebSocket and REST polling respectively)
         self._ws_data: EmlidCoordinatorData = {}
+        self._rest_data: EmlidCoordinatorData = {}
+        # Pending push of WebSocket data to listeners
+        self._flush_handle: asyncio.Handle | None = None
 
         # Satellite position history for trails (last 20 positions per satellite)
-        self._satellite_trails: dict[str, list[dict[str, Any]]] = {}
+        self._satellite_trails: dict[str, deque[dict[str, Any]]] = {}
         self._max_trail_length = 20
+        # List copy of the trails exposed in the data, rebuilt when trails change
+        self._satellite_trails_snapshot: dict[str, list[dict[str, Any]]] = {}
 
         # Register WebSocket callbacks
         self.ws_client.on("navigation", self._handle_navigation)
@@ -116,19 +192,30 @@ class EmlidDataUpdateCoordinator(DataUpdateCoordinator[EmlidCoordinatorData]):
         self.ws_client.on("active_logs", self._handle_active_logs)
         self.ws_client.on("observations", self._handle_observations)
 
-    def _should_update(self, key: str, interval: timedelta | None = None) -> bool:
+    def _build_device_info(self, device: dict[str, Any]) -> DeviceInfo:
+        """Build the device registry info from the /info device block."""
+        serial_number = device.get("serial_number", self.config_entry.entry_id)
+        return {
+            "identifiers": {(DOMAIN, serial_number)},
+            "name": "Emlid",
+            "manufacturer": MANUFACTURER,
+            "model": device.get("model", "Reach RS4"),
+            "serial_number": serial_number,
+            "sw_version": device.get("app_version"),
+        }
+
+    def _should_update(self, key: str, interval: float | None = None) -> bool:
         """Check if enough time has passed for throttled update.
 
         Args:
             key: The throttle key to check
-            interval: Optional custom interval, defaults to self._throttle_interval
+            interval: Optional custom interval in seconds, defaults to
+                self._throttle_seconds
         """
-        now = datetime.now()
-        check_interval = interval or self._throttle_interval
-        if key not in self._last_update:
-            self._last_update[key] = now
-            return True
-        if now - self._last_update[key] >= check_interval:
+        now = time.monotonic()
+        if now - self._last_update.get(key, -math.inf) >= (
+            interval or self._throttle_seconds
+        ):
             self._last_update[key] = now
             return True
         return False
@@ -161,9 +248,9 @@ class EmlidDataUpdateCoordinator(DataUpdateCoordinator[EmlidCoordinatorData]):
         # Accuracy
         accuracy = rover_pos.get("accuracy", {})
         # Horizontal accuracy is the RMS of east and north
-        e_acc = accuracy.get("e", 0.0)
-        n_acc = accuracy.get("n", 0.0)
-        nav_data["horizontal_accuracy"] = (e_acc**2 + n_acc**2) ** 0.5
+        nav_data["horizontal_accuracy"] = math.hypot(
+            accuracy.get("e", 0.0), accuracy.get("n", 0.0)
+        )
         nav_data["vertical_accuracy"] = accuracy.get("u", 0.0)
 
         # Velocity
@@ -173,7 +260,7 @@ class EmlidDataUpdateCoordinator(DataUpdateCoordinator[EmlidCoordinatorData]):
         nav_data["velocity_up"] = velocity.get("u", 0.0)
 
         self._ws_data["navigation"] = nav_data
-        self.async_set_updated_data(self._merge_data())
+        self._schedule_flush()
 
     def _handle_battery(self, data: dict[str, Any]) -> None:
         """Handle battery_status event from WebSocket."""
@@ -191,134 +278,206 @@ class EmlidDataUpdateCoordinator(DataUpdateCoordinator[EmlidCoordinatorData]):
         }
 
         self._ws_data["battery"] = battery_data
-        self.async_set_updated_data(self._merge_data())
+        self._schedule_flush()
 
     def _handle_lora_state(self, data: dict[str, Any]) -> None:
         """Handle lora_state event from WebSocket."""
-        self._ws_data["lora_connected"] = data.get("connected", False)
-        self.async_set_updated_data(self._merge_data())
+        connected = data.get("connected", False)
+        if self._ws_data.get("lora_connected") == connected:
+            return
+        self._ws_data["lora_connected"] = connected
+        self._schedule_flush()
 
     def _handle_power_supply(self, data: dict[str, Any]) -> None:
         """Handle power_supply_status event from WebSocket."""
-        self._ws_data["power_usb_connected"] = data.get("usb_cable_status", False)
-        self._ws_data["power_battery_present"] = data.get("battery_status", False)
-        self.async_set_updated_data(self._merge_data())
+        usb_connected = data.get("usb_cable_status", False)
+        battery_present = data.get("battery_status", False)
+        if (
+            self._ws_data.get("power_usb_connected") == usb_connected
+            and self._ws_data.get("power_battery_present") == battery_present
+        ):
+            return
+        self._ws_data["power_usb_connected"] = usb_connected
+        self._ws_data["power_battery_present"] = battery_present
+        self._schedule_flush()
 
     def _handle_stream_status(self, data: dict[str, Any]) -> None:
         """Handle stream_status event from WebSocket."""
-        correction_input = data.get("correction_input", [])
-        if correction_input and len(correction_input) > 0:
-            state = correction_input[0].get("state", "unknown")
-            self._ws_data["correction_input_state"] = state
-            self.async_set_updated_data(self._merge_data())
+        correction_input = data.get("correction_input")
+        if not correction_input:
+            return
+        state = correction_input[0].get("state", "unknown")
+        if self._ws_data.get("correction_input_state") == state:
+            return
+        self._ws_data["correction_input_state"] = state
+        self._schedule_flush()
 
     def _handle_active_logs(self, data: dict[str, Any]) -> None:
         """Handle active_logs event from WebSocket."""
         # Check if any log is actively writing
-        is_logging = False
-        for log_type in ["raw", "solution", "base"]:
-            if log_type in data:
-                if data[log_type].get("is_writing", False):
-                    is_logging = True
-                    break
-
+        is_logging = any(
+            isinstance(log := data.get(log_type), dict) and log.get("is_writing", False)
+            for log_type in LOG_TYPES
+        )
+        if self._ws_data.get("logging_active") == is_logging:
+            return
         self._ws_data["logging_active"] = is_logging
-        self.async_set_updated_data(self._merge_data())
+        self._schedule_flush()
 
     def _handle_observations(self, data: dict[str, Any]) -> None:
         """Handle observations event from WebSocket."""
         # Process and structure satellite observation data
+        now_ts = time.time()
         observations = {
             "satellites_count": data.get("satellites_count", {}),
             "rover_satellites": data.get("satellites", {}).get("rover", []),
             "base_satellites": data.get("satellites", {}).get("base", []),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_ts,
         }
+        observations["rover_count"] = len(observations["rover_satellites"])
 
-        # Group satellites by constellation
-        constellations = {"GPS": [], "GLONASS": [], "Galileo": [], "BeiDou": [], "QZSS": [], "SBAS": []}
-        for sat in observations["rover_satellites"]:
-            sat_id = sat.get("satellite_index", "")
-            if sat_id.startswith("G"):
-                constellations["GPS"].append(sat)
-            elif sat_id.startswith("R"):
-                constellations["GLONASS"].append(sat)
-            elif sat_id.startswith("E"):
-                constellations["Galileo"].append(sat)
-            elif sat_id.startswith("C"):
-                constellations["BeiDou"].append(sat)
-            elif sat_id.startswith("J"):
-                constellations["QZSS"].append(sat)
-            elif sat_id.startswith("S"):
-                constellations["SBAS"].append(sat)
-
-        observations["by_constellation"] = constellations
+        # Group satellites by constellation (shared empty groups while there is
+        # no lock, which is common during acquisition)
+        if observations["rover_satellites"]:
+            constellations: dict[str, list[dict[str, Any]]] = {
+                name: [] for name in CONSTELLATION_PREFIXES.values()
+            }
+            for sat in observations["rover_satellites"]:
+                name = CONSTELLATION_PREFIXES.get(sat.get("satellite_index", "")[:1])
+                if name:
+                    constellations[name].append(sat)
+            observations["by_constellation"] = constellations
+        else:
+            observations["by_constellation"] = EMPTY_CONSTELLATIONS
 
         # Update satellite trails (position history for sky plot)
         # Only update trails every 5 minutes to show meaningful movement
         # 20 points × 5 minutes = 100 minutes (1h 40m) of satellite movement history
-        if self._should_update("satellite_trails", timedelta(minutes=5)):
+        if self._should_update("satellite_trails", 300.0):
             for sat in observations["rover_satellites"]:
                 sat_id = sat.get("satellite_index", "")
                 if sat_id:
                     # Initialize trail if needed
                     if sat_id not in self._satellite_trails:
-                        self._satellite_trails[sat_id] = []
+                        self._satellite_trails[sat_id] = deque(
+                            maxlen=self._max_trail_length
+                        )
 
                     # Add current position to trail
                     self._satellite_trails[sat_id].append({
                         "azimuth": sat.get("azimuth", 0),
                         "elevation": sat.get("elevation", 0),
                         "snr": sat.get("signal_to_noise_ratio", 0),
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": now_ts,
                     })
 
-                    # Keep only last N positions
-                    if len(self._satellite_trails[sat_id]) > self._max_trail_length:
-                        self._satellite_trails[sat_id] = self._satellite_trails[sat_id][-self._max_trail_length:]
-
             # Clean up trails for satellites no longer visible
-            current_sat_ids = {sat.get("satellite_index") for sat in observations["rover_satellites"]}
-            trails_to_remove = [sat_id for sat_id in self._satellite_trails if sat_id not in current_sat_ids]
-            for sat_id in trails_to_remove:
-                del self._satellite_trails[sat_id]
+            current_sat_ids = {
+                sat_id
+                for sat in observations["rover_satellites"]
+                if (sat_id := sat.get("satellite_index"))
+            }
+            self._satellite_trails = {
+                sat_id: trail
+                for sat_id, trail in self._satellite_trails.items()
+                if sat_id in current_sat_ids
+            }
+
+            self._satellite_trails_snapshot = {
+                sat_id: list(trail) for sat_id, trail in self._satellite_trails.items()
+            }
 
         # Add trails to observations
-        observations["satellite_trails"] = self._satellite_trails
+        observations["satellite_trails"] = self._satellite_trails_snapshot
 
         self._ws_data["satellite_observations"] = observations
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Schedule a single listener update for WebSocket data.
+
+        The WebSocket client already coalesces events and runs a window's
+        handlers in one loop, so flushing on the next loop iteration is
+        enough to push them as one update without adding latency.
+        """
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_soon(self._flush)
+
+    def _flush(self) -> None:
+        """Push the merged WebSocket and REST data to listeners."""
+        self._flush_handle = None
         self.async_set_updated_data(self._merge_data())
 
+    async def async_shutdown(self) -> None:
+        """Cancel any pending WebSocket flush and shut down the coordinator."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        await super().async_shutdown()
+
     def _merge_data(self) -> EmlidCoordinatorData:
-        """Merge WebSocket data with REST data."""
-        # Start with REST data if available
-        merged = self.data.copy() if self.data else {}
-        # Overlay WebSocket data
-        merged.update(self._ws_data)
-        return merged
+        """Merge WebSocket data over REST data."""
+        return {**self._rest_data, **self._ws_data}
 
     async def _async_update_data(self) -> EmlidCoordinatorData:
         """Fetch data from REST API (periodic polling)."""
         try:
-            async with asyncio.TaskGroup() as tg:
-                info_task = tg.create_task(self.api_client.get_info())
-                config_task = tg.create_task(self.api_client.get_configuration())
-                wifi_task = tg.create_task(self.api_client.get_wifi_status())
-                bluetooth_task = tg.create_task(self.api_client.get_bluetooth_status())
-                lora_rssi_task = tg.create_task(self.api_client.get_lora_rssi())
-
+            results: dict[str, Any] = await self.api_client.get_all(REST_ENDPOINTS)
+            if "/lora/rssi" in results:
+                results["/lora/rssi"] = results["/lora/rssi"].get("rssi", -1)
+
+            # Endpoints that failed this round are left out, so the entities
+            # reading them become unavailable. Only the static /info block is
+            # carried over once it has been fetched.
+            previous = self._rest_data
+            if "/info" not in results and "device_info" not in previous:
+                raise EmlidAPIError("Failed to fetch /info")
             rest_data: EmlidCoordinatorData = {
-                "device_info": info_task.result(),
-                "configuration": config_task.result(),
-                "wifi_status": wifi_task.result(),
-                "bluetooth_status": bluetooth_task.result(),
-                "lora_rssi": lora_rssi_task.result().get("rssi", -1),
+                key: results[endpoint]
+                for endpoint, key in REST_ENDPOINTS.items()
+                if endpoint in results
             }
+            if "device_info" not in rest_data:
+                rest_data["device_info"] = previous["device_info"]
+
+            if "device_info" not in previous:
+                device = rest_data["device_info"].get("device", {})
+                self.device_info = self._build_device_info(device)
+                _LOGGER.debug(
+                    "Connected to Emlid %s (SN: %s)",
+                    device.get("model", "Unknown"),
+                    device.get("serial_number", "Unknown"),
+                )
 
-            # Merge with WebSocket data
-            return {**rest_data, **self._ws_data}
+            self._rest_data = rest_data
+            return self._merge_data()
 
         except EmlidAPIError as err:
             raise UpdateFailed(f"Error communicating with Emlid device: {err}") from err
         except Exception as err:
             raise UpdateFailed(f"Unexpected error: {err}") from err
+
+
+class EmlidCoordinatorEntity(CoordinatorEntity[EmlidDataUpdateCoordinator]):
+    """Coordinator entity that caches its state once per coordinator update.
+
+    Subclasses set their ``_attr_*`` values, including ``_attr_available``, in
+    ``_update_from_coordinator`` and call it at the end of ``__init__``.
+    ``CoordinatorEntity.available`` only reports ``last_update_success`` and
+    never reads ``_attr_available``, so ``available`` combines the two.
+    """
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    def _update_from_coordinator(self) -> None:
+        """Cache availability and state from the latest coordinator data."""
+        raise NotImplementedError
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return super().available and self._attr_available
@@ -8,11 +8,9 @@ from typing import TYPE_CHECKING
 from homeassistant.components.device_tracker import SourceType, TrackerEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import EmlidConfigEntry
-from .const import DOMAIN, MANUFACTURER
-from .coordinator import EmlidDataUpdateCoordinator
+from .coordinator import EmlidCoordinatorEntity, EmlidDataUpdateCoordinator
 
 if TYPE_CHECKING:
     pass
@@ -31,12 +29,14 @@ async def async_setup_entry(
     async_add_entities([EmlidDeviceTracker(coordinator, config_entry)])
 
 
-class EmlidDeviceTracker(CoordinatorEntity[EmlidDataUpdateCoordinator], TrackerEntity):
+class EmlidDeviceTracker(EmlidCoordinatorEntity, TrackerEntity):
     """Representation of an Emlid GNSS device tracker."""
 
     _attr_has_entity_name = True
     _attr_name = "Location"
     _attr_icon = "mdi:map-marker"
+    _attr_latitude: float | None = None
+    _attr_longitude: float | None = None
 
     def __init__(
         self,
@@ -46,53 +46,37 @@ class EmlidDeviceTracker(CoordinatorEntity[EmlidDataUpdateCoordinator], TrackerE
         """Initialize the device tracker."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{config_entry.entry_id}_location"
+        self._attr_device_info = coordinator.device_info
+        self._update_from_coordinator()
 
-        # Device info
-        device_info = coordinator.data.get("device_info", {}).get("device", {})
-        serial_number = device_info.get("serial_number", config_entry.entry_id)
-        model = device_info.get("model", "Reach RS4")
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, serial_number)},
-            "name": "Emlid",
-            "manufacturer": MANUFACTURER,
-            "model": model,
-            "serial_number": serial_number,
-            "sw_version": device_info.get("app_version"),
-        }
-
+    # Older TrackerEntity releases have no _attr_latitude/_attr_longitude
+    # support, so the cached values are returned explicitly
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the device."""
-        nav_data = self.coordinator.data.get("navigation", {})
-        return nav_data.get("latitude")
+        return self._attr_latitude
 
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the device."""
-        nav_data = self.coordinator.data.get("navigation", {})
-        return nav_data.get("longitude")
+        return self._attr_longitude
 
     @property
     def source_type(self) -> SourceType:
         """Return the source type of the device."""
         return SourceType.GPS
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and "navigation" in self.coordinator.data
-            and self.latitude is not None
-            and self.longitude is not None
-        )
-
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra attributes."""
+    def _update_from_coordinator(self) -> None:
+        """Cache availability and attributes from the latest navigation data."""
         nav_data = self.coordinator.data.get("navigation", {})
-        return {
+        self._attr_latitude = nav_data.get("latitude")
+        self._attr_longitude = nav_data.get("longitude")
+        self._attr_available = (
+            "navigation" in self.coordinator.data
+            and self._attr_latitude is not None
+            and self._attr_longitude is not None
+        )
+        self._attr_extra_state_attributes = {
             "altitude": nav_data.get("altitude"),
             "accuracy": nav_data.get("horizontal_accuracy"),
             "solution": nav_data.get("solution"),
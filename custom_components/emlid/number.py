@@ -14,8 +14,13 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import EmlidConfigEntry
-from .const import DOMAIN, MANUFACTURER
-from .coordinator import EmlidDataUpdateCoordinator
+from .api import EmlidAPIClient
+from .coordinator import (
+    EmlidDataUpdateCoordinator,
+    always_available,
+    config_available,
+    path_getter,
+)
 
 if TYPE_CHECKING:
     pass
@@ -29,7 +34,23 @@ class EmlidNumberEntityDescription(NumberEntityDescription):
 
     value_fn: Callable[[dict[str, Any]], float | None]
     set_value_fn: Callable[[float], Any]
-    available_fn: Callable[[dict[str, Any]], bool] = lambda data: True
+    available_fn: Callable[[dict[str, Any]], bool] = always_available
+
+
+def _positioning_getter(field: str) -> Callable[[dict[str, Any]], Any]:
+    """Return a value_fn reading a top-level positioning setting."""
+    return path_getter("configuration", "positioning_settings", field)
+
+
+def _positioning_setter(
+    api_client: EmlidAPIClient, field: str, cast: Callable[[float], Any] = int
+) -> Callable[[float], Any]:
+    """Return a set_value_fn writing a top-level positioning setting."""
+
+    def set_value(value: float) -> Any:
+        return api_client.set_positioning_settings(**{field: cast(value)})
+
+    return set_value
 
 
 async def async_setup_entry(
@@ -52,11 +73,9 @@ async def async_setup_entry(
             native_max_value=10.0,
             native_step=0.001,
             mode=NumberMode.BOX,
-            value_fn=lambda data: data.get("configuration", {})
-            .get("device", {})
-            .get("antenna_height"),
+            value_fn=path_getter("configuration", "device", "antenna_height"),
             set_value_fn=lambda value: api_client.set_device_config(antenna_height=value),
-            available_fn=lambda data: "configuration" in data,
+            available_fn=config_available,
         ),
         EmlidNumberEntityDescription(
             key="update_rate",
@@ -69,14 +88,13 @@ async def async_setup_entry(
             native_step=1,
             mode=NumberMode.SLIDER,
             entity_registry_enabled_default=False,
-            value_fn=lambda data: data.get("configuration", {})
-            .get("positioning_settings", {})
-            .get("gnss_settings", {})
-            .get("update_rate"),
+            value_fn=path_getter(
+                "configuration", "positioning_settings", "gnss_settings", "update_rate"
+            ),
             set_value_fn=lambda value: api_client.set_positioning_settings(
                 gnss_settings={"update_rate": int(value)}
             ),
-            available_fn=lambda data: "configuration" in data,
+            available_fn=config_available,
         ),
         EmlidNumberEntityDescription(
             key="elevation_mask",
@@ -89,13 +107,9 @@ async def async_setup_entry(
             native_step=1,
             mode=NumberMode.SLIDER,
             entity_registry_enabled_default=False,
-            value_fn=lambda data: data.get("configuration", {})
-            .get("positioning_settings", {})
-            .get("elevation_mask_angle"),
-            set_value_fn=lambda value: api_client.set_positioning_settings(
-                elevation_mask_angle=int(value)
-            ),
-            available_fn=lambda data: "configuration" in data,
+            value_fn=_positioning_getter("elevation_mask_angle"),
+            set_value_fn=_positioning_setter(api_client, "elevation_mask_angle"),
+            available_fn=config_available,
         ),
         EmlidNumberEntityDescription(
             key="snr_mask",
@@ -108,13 +122,9 @@ async def async_setup_entry(
             native_step=1,
             mode=NumberMode.SLIDER,
             entity_registry_enabled_default=False,
-            value_fn=lambda data: data.get("configuration", {})
-            .get("positioning_settings", {})
-            .get("snr_mask"),
-            set_value_fn=lambda value: api_client.set_positioning_settings(
-                snr_mask=int(value)
-            ),
-            available_fn=lambda data: "configuration" in data,
+            value_fn=_positioning_getter("snr_mask"),
+            set_value_fn=_positioning_setter(api_client, "snr_mask"),
+            available_fn=config_available,
         ),
         EmlidNumberEntityDescription(
             key="max_horizontal_acceleration",
@@ -127,13 +137,9 @@ async def async_setup_entry(
             native_step=0.1,
             mode=NumberMode.BOX,
             entity_registry_enabled_default=False,
-            value_fn=lambda data: data.get("configuration", {})
-            .get("positioning_settings", {})
-            .get("max_horizontal_acceleration"),
-            set_value_fn=lambda value: api_client.set_positioning_settings(
-                max_horizontal_acceleration=float(value)
-            ),
-            available_fn=lambda data: "configuration" in data,
+            value_fn=_positioning_getter("max_horizontal_acceleration"),
+            set_value_fn=_positioning_setter(api_client, "max_horizontal_acceleration", float),
+            available_fn=config_available,
         ),
         EmlidNumberEntityDescription(
             key="max_vertical_acceleration",
@@ -146,13 +152,9 @@ async def async_setup_entry(
             native_step=0.1,
             mode=NumberMode.BOX,
             entity_registry_enabled_default=False,
-            value_fn=lambda data: data.get("configuration", {})
-            .get("positioning_settings", {})
-            .get("max_vertical_acceleration"),
-            set_value_fn=lambda value: api_client.set_positioning_settings(
-                max_vertical_acceleration=float(value)
-            ),
-            available_fn=lambda data: "configuration" in data,
+            value_fn=_positioning_getter("max_vertical_acceleration"),
+            set_value_fn=_positioning_setter(api_client, "max_vertical_acceleration", float),
+            available_fn=config_available,
         ),
     ]
 
@@ -180,20 +182,7 @@ class EmlidNumber(CoordinatorEntity[EmlidDataUpdateCoordinator], NumberEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{config_entry.entry_id}_{description.key}"
-
-        # Device info
-        device_info = coordinator.data.get("device_info", {}).get("device", {})
-        serial_number = device_info.get("serial_number", config_entry.entry_id)
-        model = device_info.get("model", "Reach RS4")
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, serial_number)},
-            "name": "Emlid",
-            "manufacturer": MANUFACTURER,
-            "model": model,
-            "serial_number": serial_number,
-            "sw_version": device_info.get("app_version"),
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float | None:
@@ -13,8 +13,12 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import EmlidConfigEntry
-from .const import DOMAIN, MANUFACTURER
-from .coordinator import EmlidDataUpdateCoordinator
+from .coordinator import (
+    EmlidDataUpdateCoordinator,
+    always_available,
+    config_available,
+    path_getter,
+)
 
 if TYPE_CHECKING:
     pass
@@ -28,7 +32,7 @@ class EmlidSelectEntityDescription(SelectEntityDescription):
 
     value_fn: Callable[[dict[str, Any]], str | None]
     set_value_fn: Callable[[str], Any]
-    available_fn: Callable[[dict[str, Any]], bool] = lambda data: True
+    available_fn: Callable[[dict[str, Any]], bool] = always_available
 
 
 async def async_setup_entry(
@@ -48,13 +52,13 @@ async def async_setup_entry(
             icon="mdi:navigation-variant",
             options=["kinematic", "static", "stop-and-go"],
             entity_registry_enabled_default=False,
-            value_fn=lambda data: data.get("configuration", {})
-            .get("positioning_settings", {})
-            .get("positioning_mode"),
+            value_fn=path_getter(
+                "configuration", "positioning_settings", "positioning_mode"
+            ),
             set_value_fn=lambda value: api_client.set_positioning_settings(
                 positioning_mode=value
             ),
-            available_fn=lambda data: "configuration" in data,
+            available_fn=config_available,
         ),
         EmlidSelectEntityDescription(
             key="gps_ar_mode",
@@ -63,13 +67,13 @@ async def async_setup_entry(
             icon="mdi:radar",
             options=["fix-and-hold", "continuous"],
             entity_registry_enabled_default=False,
-            value_fn=lambda data: data.get("configuration", {})
-            .get("positioning_settings", {})
-            .get("gps_ar_mode"),
+            value_fn=path_getter(
+                "configuration", "positioning_settings", "gps_ar_mode"
+            ),
             set_value_fn=lambda value: api_client.set_positioning_settings(
                 gps_ar_mode=value
             ),
-            available_fn=lambda data: "configuration" in data,
+            available_fn=config_available,
         ),
     ]
 
@@ -97,20 +101,7 @@ class EmlidSelect(CoordinatorEntity[EmlidDataUpdateCoordinator], SelectEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{config_entry.entry_id}_{description.key}"
-
-        # Device info
-        device_info = coordinator.data.get("device_info", {}).get("device", {})
-        serial_number = device_info.get("serial_number", config_entry.entry_id)
-        model = device_info.get("model", "Reach RS4")
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, serial_number)},
-            "name": "Emlid",
-            "manufacturer": MANUFACTURER,
-            "model": model,
-            "serial_number": serial_number,
-            "sw_version": device_info.get("app_version"),
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def current_option(self) -> str | None:
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
@@ -24,11 +25,13 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import EmlidConfigEntry
-from .const import DOMAIN, MANUFACTURER
-from .coordinator import EmlidDataUpdateCoordinator
+from .coordinator import (
+    EmlidCoordinatorEntity,
+    EmlidDataUpdateCoordinator,
+    deep_get,
+)
 
 if TYPE_CHECKING:
     pass
@@ -38,10 +41,26 @@ _LOGGER = logging.getLogger(__name__)
 
 @dataclass(frozen=True, kw_only=True)
 class EmlidSensorEntityDescription(SensorEntityDescription):
-    """Describes Emlid sensor entity."""
+    """Describes Emlid sensor entity.
+
+    ``path`` locates the value in the coordinator data. ``value_fn``
+    overrides the lookup for derived values, and ``available_fn`` overrides
+    the default check that the first key of the path is present.
+    """
+
+    path: tuple[str, ...]
+    value_fn: Callable[[dict[str, Any]], StateType] | None = None
+    available_fn: Callable[[dict[str, Any]], bool] | None = None
+
+
+def _lora_rssi_available(data: dict[str, Any]) -> bool:
+    """Return whether the LoRa radio has reported a signal strength."""
+    return data.get("lora_rssi", -1) != -1
 
-    value_fn: Callable[[dict[str, Any]], StateType]
-    available_fn: Callable[[dict[str, Any]], bool] = lambda data: True
+
+def _wifi_network_available(data: dict[str, Any]) -> bool:
+    """Return whether WiFi is joined to a network."""
+    return deep_get(data, ("wifi_status", "current_network")) is not None
 
 
 SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
@@ -51,8 +70,7 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         translation_key="solution",
         name="Solution Status",
         icon="mdi:crosshairs-gps",
-        value_fn=lambda data: data.get("navigation", {}).get("solution"),
-        available_fn=lambda data: "navigation" in data,
+        path=("navigation", "solution"),
     ),
     EmlidSensorEntityDescription(
         key="latitude",
@@ -61,8 +79,7 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         icon="mdi:latitude",
         native_unit_of_measurement="°",
         suggested_display_precision=10,
-        value_fn=lambda data: round(data.get("navigation", {}).get("latitude", 0), 10),
-        available_fn=lambda data: "navigation" in data,
+        path=("navigation", "latitude"),
     ),
     EmlidSensorEntityDescription(
         key="longitude",
@@ -71,8 +88,7 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         icon="mdi:longitude",
         native_unit_of_measurement="°",
         suggested_display_precision=10,
-        value_fn=lambda data: round(data.get("navigation", {}).get("longitude", 0), 10),
-        available_fn=lambda data: "navigation" in data,
+        path=("navigation", "longitude"),
     ),
     EmlidSensorEntityDescription(
         key="altitude",
@@ -83,8 +99,7 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
-        value_fn=lambda data: round(data.get("navigation", {}).get("altitude", 0), 3),
-        available_fn=lambda data: "navigation" in data,
+        path=("navigation", "altitude"),
     ),
     EmlidSensorEntityDescription(
         key="horizontal_accuracy",
@@ -95,10 +110,7 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
-        value_fn=lambda data: round(
-            data.get("navigation", {}).get("horizontal_accuracy", 0), 3
-        ),
-        available_fn=lambda data: "navigation" in data,
+        path=("navigation", "horizontal_accuracy"),
     ),
     EmlidSensorEntityDescription(
         key="vertical_accuracy",
@@ -109,8 +121,7 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
-        value_fn=lambda data: round(data.get("navigation", {}).get("vertical_accuracy", 0), 3),
-        available_fn=lambda data: "navigation" in data,
+        path=("navigation", "vertical_accuracy"),
     ),
     EmlidSensorEntityDescription(
         key="baseline",
@@ -121,16 +132,14 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
-        value_fn=lambda data: round(data.get("navigation", {}).get("baseline", 0), 1),
-        available_fn=lambda data: "navigation" in data,
+        path=("navigation", "baseline"),
     ),
     EmlidSensorEntityDescription(
         key="positioning_mode",
         translation_key="positioning_mode",
         name="Positioning Mode",
         icon="mdi:navigation-variant",
-        value_fn=lambda data: data.get("navigation", {}).get("positioning_mode"),
-        available_fn=lambda data: "navigation" in data,
+        path=("navigation", "positioning_mode"),
     ),
     # Satellite sensors
     EmlidSensorEntityDescription(
@@ -139,8 +148,7 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         name="Satellites (Rover)",
         icon="mdi:satellite-variant",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("navigation", {}).get("satellites_rover", 0),
-        available_fn=lambda data: "navigation" in data,
+        path=("navigation", "satellites_rover"),
     ),
     EmlidSensorEntityDescription(
         key="satellites_valid",
@@ -148,8 +156,7 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         name="Satellites (Valid)",
         icon="mdi:satellite-uplink",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("navigation", {}).get("satellites_valid", 0),
-        available_fn=lambda data: "navigation" in data,
+        path=("navigation", "satellites_valid"),
     ),
     EmlidSensorEntityDescription(
         key="hdop",
@@ -158,8 +165,7 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         icon="mdi:signal-variant",
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=2,
-        value_fn=lambda data: round(data.get("navigation", {}).get("hdop", 0), 2),
-        available_fn=lambda data: "navigation" in data,
+        path=("navigation", "hdop"),
     ),
     # Battery sensors
     EmlidSensorEntityDescription(
@@ -169,8 +175,7 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("battery", {}).get("state_of_charge"),
-        available_fn=lambda data: "battery" in data,
+        path=("battery", "state_of_charge"),
     ),
     EmlidSensorEntityDescription(
         key="battery_voltage",
@@ -180,8 +185,7 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=2,
-        value_fn=lambda data: round(data.get("battery", {}).get("voltage", 0), 2),
-        available_fn=lambda data: "battery" in data,
+        path=("battery", "voltage"),
     ),
     EmlidSensorEntityDescription(
         key="battery_current",
@@ -191,8 +195,7 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=2,
-        value_fn=lambda data: round(data.get("battery", {}).get("current", 0), 2),
-        available_fn=lambda data: "battery" in data,
+        path=("battery", "current"),
     ),
     EmlidSensorEntityDescription(
         key="battery_temperature",
@@ -202,16 +205,14 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
-        value_fn=lambda data: round(data.get("battery", {}).get("temperature", 0), 1),
-        available_fn=lambda data: "battery" in data,
+        path=("battery", "temperature"),
     ),
     EmlidSensorEntityDescription(
         key="charging_status",
         translation_key="charging_status",
         name="Charging Status",
         icon="mdi:battery-charging",
-        value_fn=lambda data: data.get("battery", {}).get("charger_status"),
-        available_fn=lambda data: "battery" in data,
+        path=("battery", "charger_status"),
     ),
     # Communication sensors
     EmlidSensorEntityDescription(
@@ -222,27 +223,23 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: data.get("lora_rssi") if data.get("lora_rssi", -1) != -1 else None,
-        available_fn=lambda data: "lora_rssi" in data and data["lora_rssi"] != -1,
+        path=("lora_rssi",),
+        available_fn=_lora_rssi_available,
     ),
     EmlidSensorEntityDescription(
         key="correction_input_state",
         translation_key="correction_input_state",
         name="Correction Input State",
         icon="mdi:antenna",
-        value_fn=lambda data: data.get("correction_input_state"),
-        available_fn=lambda data: "correction_input_state" in data,
+        path=("correction_input_state",),
     ),
     EmlidSensorEntityDescription(
         key="wifi_ssid",
         translation_key="wifi_ssid",
         name="WiFi SSID",
         icon="mdi:wifi",
-        value_fn=lambda data: data.get("wifi_status", {})
-        .get("current_network", {})
-        .get("ssid"),
-        available_fn=lambda data: "wifi_status" in data
-        and data["wifi_status"].get("current_network") is not None,
+        path=("wifi_status", "current_network", "ssid"),
+        available_fn=_wifi_network_available,
     ),
     # Device info sensors
     EmlidSensorEntityDescription(
@@ -251,10 +248,7 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         name="Device Role",
         icon="mdi:label",
         entity_registry_enabled_default=False,
-        value_fn=lambda data: data.get("configuration", {})
-        .get("device", {})
-        .get("role"),
-        available_fn=lambda data: "configuration" in data,
+        path=("configuration", "device", "role"),
     ),
     EmlidSensorEntityDescription(
         key="firmware",
@@ -262,10 +256,7 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         name="Firmware Version",
         icon="mdi:chip",
         entity_registry_enabled_default=False,
-        value_fn=lambda data: data.get("device_info", {})
-        .get("device", {})
-        .get("app_version"),
-        available_fn=lambda data: "device_info" in data,
+        path=("device_info", "device", "app_version"),
     ),
     EmlidSensorEntityDescription(
         key="satellite_observations",
@@ -273,14 +264,18 @@ SENSOR_DESCRIPTIONS: tuple[EmlidSensorEntityDescription, ...] = (
         name="Satellite Observations",
         icon="mdi:satellite-variant",
         entity_registry_enabled_default=False,
-        value_fn=lambda data: len(
-            data.get("satellite_observations", {}).get("rover_satellites", [])
-        ),
-        available_fn=lambda data: "satellite_observations" in data,
+        path=("satellite_observations", "rover_count"),
     ),
 )
 
 
+def _format_timestamp(timestamp: float | None) -> str | None:
+    """Format an epoch timestamp as a local ISO 8601 string."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: EmlidConfigEntry,
@@ -297,7 +292,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class EmlidSensor(CoordinatorEntity[EmlidDataUpdateCoordinator], SensorEntity):
+class EmlidSensor(EmlidCoordinatorEntity, SensorEntity):
     """Representation of an Emlid sensor."""
 
     entity_description: EmlidSensorEntityDescription
@@ -313,46 +308,38 @@ class EmlidSensor(CoordinatorEntity[EmlidDataUpdateCoordinator], SensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{config_entry.entry_id}_{description.key}"
+        self._attr_device_info = coordinator.device_info
+        self._update_from_coordinator()
 
-        # Device info
-        device_info = coordinator.data.get("device_info", {}).get("device", {})
-        serial_number = device_info.get("serial_number", config_entry.entry_id)
-        model = device_info.get("model", "Reach RS4")
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, serial_number)},
-            "name": "Emlid",
-            "manufacturer": MANUFACTURER,
-            "model": model,
-            "serial_number": serial_number,
-            "sw_version": device_info.get("app_version"),
-        }
-
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        return self.entity_description.value_fn(self.coordinator.data)
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.entity_description.available_fn(self.coordinator.data)
-        )
+    def _update_from_coordinator(self) -> None:
+        """Cache availability and state from the latest coordinator data."""
+        description = self.entity_description
+        data = self.coordinator.data
+        if description.available_fn is not None:
+            self._attr_available = description.available_fn(data)
+        else:
+            self._attr_available = description.path[0] in data
+        if not self._attr_available:
+            self._attr_native_value = None
+        elif description.value_fn is not None:
+            self._attr_native_value = description.value_fn(data)
+        else:
+            self._attr_native_value = deep_get(data, description.path)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
         # Add detailed satellite observation data as attributes for the satellite_observations sensor
-        if self.entity_description.key == "satellite_observations":
-            obs_data = self.coordinator.data.get("satellite_observations", {})
-            return {
-                "satellites_count": obs_data.get("satellites_count", {}),
-                "rover_satellites": obs_data.get("rover_satellites", []),
-                "base_satellites": obs_data.get("base_satellites", []),
-                "by_constellation": obs_data.get("by_constellation", {}),
-                "satellite_trails": obs_data.get("satellite_trails", {}),
-                "timestamp": obs_data.get("timestamp"),
-            }
-        return None
+        if self.entity_description.key != "satellite_observations":
+            return None
+        obs_data = self.coordinator.data.get("satellite_observations")
+        if not obs_data:
+            return None
+        return {
+            "satellites_count": obs_data.get("satellites_count", {}),
+            "rover_satellites": obs_data.get("rover_satellites", []),
+            "base_satellites": obs_data.get("base_satellites", []),
+            "by_constellation": obs_data.get("by_constellation", {}),
+            "satellite_trails": obs_data.get("satellite_trails", {}),
+            "timestamp": _format_timestamp(obs_data.get("timestamp")),
+        }
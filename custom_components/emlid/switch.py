@@ -5,16 +5,22 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from functools import partial
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import EmlidConfigEntry
-from .const import DOMAIN, MANUFACTURER
-from .coordinator import EmlidDataUpdateCoordinator
+from .api import EmlidAPIClient
+from .coordinator import (
+    EmlidCoordinatorEntity,
+    EmlidDataUpdateCoordinator,
+    always_available,
+    config_available,
+    path_getter,
+)
 
 if TYPE_CHECKING:
     pass
@@ -29,7 +35,51 @@ class EmlidSwitchEntityDescription(SwitchEntityDescription):
     value_fn: Callable[[dict[str, Any]], bool | None]
     turn_on_fn: Callable
     turn_off_fn: Callable
-    available_fn: Callable[[dict[str, Any]], bool] = lambda data: True
+    available_fn: Callable[[dict[str, Any]], bool] = always_available
+
+
+# Positioning systems with an enable switch, as (settings key, display name)
+GNSS_SYSTEMS: Final = (
+    ("gps", "GPS"),
+    ("glonass", "GLONASS"),
+    ("galileo", "Galileo"),
+    ("beidou", "BeiDou"),
+    ("qzss", "QZSS"),
+)
+
+
+def _logging_available(data: dict[str, Any]) -> bool:
+    """Return whether the logging state has been reported."""
+    return "logging_active" in data
+
+
+def _make_gnss_switch(
+    api_client: EmlidAPIClient, system: str, name: str
+) -> EmlidSwitchEntityDescription:
+    """Describe the enable switch for one positioning system."""
+    return EmlidSwitchEntityDescription(
+        key=f"gnss_{system}",
+        translation_key=f"gnss_{system}",
+        name=name,
+        icon="mdi:satellite-variant",
+        entity_registry_enabled_default=False,
+        value_fn=path_getter(
+            "configuration",
+            "positioning_settings",
+            "gnss_settings",
+            "positioning_systems",
+            system,
+        ),
+        turn_on_fn=partial(
+            api_client.set_positioning_settings,
+            gnss_settings={"positioning_systems": {system: True}},
+        ),
+        turn_off_fn=partial(
+            api_client.set_positioning_settings,
+            gnss_settings={"positioning_systems": {system: False}},
+        ),
+        available_fn=config_available,
+    )
 
 
 async def async_setup_entry(
@@ -48,148 +98,25 @@ async def async_setup_entry(
             translation_key="night_mode",
             name="Night Mode",
             icon="mdi:weather-night",
-            value_fn=lambda data: data.get("configuration", {})
-            .get("device", {})
-            .get("night_mode"),
-            turn_on_fn=lambda: api_client.set_device_config(night_mode=True),
-            turn_off_fn=lambda: api_client.set_device_config(night_mode=False),
-            available_fn=lambda data: "configuration" in data,
+            value_fn=path_getter("configuration", "device", "night_mode"),
+            turn_on_fn=partial(api_client.set_device_config, night_mode=True),
+            turn_off_fn=partial(api_client.set_device_config, night_mode=False),
+            available_fn=config_available,
         ),
         EmlidSwitchEntityDescription(
             key="data_logging",
             translation_key="data_logging",
             name="Data Logging",
             icon="mdi:database",
-            value_fn=lambda data: data.get("logging_active"),
-            turn_on_fn=lambda: api_client.set_logging_state(True),
-            turn_off_fn=lambda: api_client.set_logging_state(False),
-            available_fn=lambda data: "logging_active" in data,
+            value_fn=path_getter("logging_active"),
+            turn_on_fn=partial(api_client.set_logging_state, True),
+            turn_off_fn=partial(api_client.set_logging_state, False),
+            available_fn=_logging_available,
         ),
         # GNSS System switches
-        EmlidSwitchEntityDescription(
-            key="gnss_gps",
-            translation_key="gnss_gps",
-            name="GPS",
-            icon="mdi:satellite-variant",
-            entity_registry_enabled_default=False,
-            value_fn=lambda data: (
-                data.get("configuration", {})
-                .get("positioning_settings", {})
-                .get("gnss_settings", {})
-                .get("positioning_systems", {})
-                .get("gps")
-            ),
-            turn_on_fn=lambda: api_client.set_positioning_settings(
-                gnss_settings={
-                    "positioning_systems": {"gps": True}
-                }
-            ),
-            turn_off_fn=lambda: api_client.set_positioning_settings(
-                gnss_settings={
-                    "positioning_systems": {"gps": False}
-                }
-            ),
-            available_fn=lambda data: "configuration" in data,
-        ),
-        EmlidSwitchEntityDescription(
-            key="gnss_glonass",
-            translation_key="gnss_glonass",
-            name="GLONASS",
-            icon="mdi:satellite-variant",
-            entity_registry_enabled_default=False,
-            value_fn=lambda data: (
-                data.get("configuration", {})
-                .get("positioning_settings", {})
-                .get("gnss_settings", {})
-                .get("positioning_systems", {})
-                .get("glonass")
-            ),
-            turn_on_fn=lambda: api_client.set_positioning_settings(
-                gnss_settings={
-                    "positioning_systems": {"glonass": True}
-                }
-            ),
-            turn_off_fn=lambda: api_client.set_positioning_settings(
-                gnss_settings={
-                    "positioning_systems": {"glonass": False}
-                }
-            ),
-            available_fn=lambda data: "configuration" in data,
-        ),
-        EmlidSwitchEntityDescription(
-            key="gnss_galileo",
-            translation_key="gnss_galileo",
-            name="Galileo",
-            icon="mdi:satellite-variant",
-            entity_registry_enabled_default=False,
-            value_fn=lambda data: (
-                data.get("configuration", {})
-                .get("positioning_settings", {})
-                .get("gnss_settings", {})
-                .get("positioning_systems", {})
-                .get("galileo")
-            ),
-            turn_on_fn=lambda: api_client.set_positioning_settings(
-                gnss_settings={
-                    "positioning_systems": {"galileo": True}
-                }
-            ),
-            turn_off_fn=lambda: api_client.set_positioning_settings(
-                gnss_settings={
-                    "positioning_systems": {"galileo": False}
-                }
-            ),
-            available_fn=lambda data: "configuration" in data,
-        ),
-        EmlidSwitchEntityDescription(
-            key="gnss_beidou",
-            translation_key="gnss_beidou",
-            name="BeiDou",
-            icon="mdi:satellite-variant",
-            entity_registry_enabled_default=False,
-            value_fn=lambda data: (
-                data.get("configuration", {})
-                .get("positioning_settings", {})
-                .get("gnss_settings", {})
-                .get("positioning_systems", {})
-                .get("beidou")
-            ),
-            turn_on_fn=lambda: api_client.set_positioning_settings(
-                gnss_settings={
-                    "positioning_systems": {"beidou": True}
-                }
-            ),
-            turn_off_fn=lambda: api_client.set_positioning_settings(
-                gnss_settings={
-                    "positioning_systems": {"beidou": False}
-                }
-            ),
-            available_fn=lambda data: "configuration" in data,
-        ),
-        EmlidSwitchEntityDescription(
-            key="gnss_qzss",
-            translation_key="gnss_qzss",
-            name="QZSS",
-            icon="mdi:satellite-variant",
-            entity_registry_enabled_default=False,
-            value_fn=lambda data: (
-                data.get("configuration", {})
-                .get("positioning_settings", {})
-                .get("gnss_settings", {})
-                .get("positioning_systems", {})
-                .get("qzss")
-            ),
-            turn_on_fn=lambda: api_client.set_positioning_settings(
-                gnss_settings={
-                    "positioning_systems": {"qzss": True}
-                }
-            ),
-            turn_off_fn=lambda: api_client.set_positioning_settings(
-                gnss_settings={
-                    "positioning_systems": {"qzss": False}
-                }
-            ),
-            available_fn=lambda data: "configuration" in data,
+        *(
+            _make_gnss_switch(api_client, system, name)
+            for system, name in GNSS_SYSTEMS
         ),
     ]
 
@@ -201,7 +128,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class EmlidSwitch(CoordinatorEntity[EmlidDataUpdateCoordinator], SwitchEntity):
+class EmlidSwitch(EmlidCoordinatorEntity, SwitchEntity):
     """Representation of an Emlid switch."""
 
     entity_description: EmlidSwitchEntityDescription
@@ -217,33 +144,15 @@ class EmlidSwitch(CoordinatorEntity[EmlidDataUpdateCoordinator], SwitchEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{config_entry.entry_id}_{description.key}"
-
-        # Device info
-        device_info = coordinator.data.get("device_info", {}).get("device", {})
-        serial_number = device_info.get("serial_number", config_entry.entry_id)
-        model = device_info.get("model", "Reach RS4")
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, serial_number)},
-            "name": "Emlid",
-            "manufacturer": MANUFACTURER,
-            "model": model,
-            "serial_number": serial_number,
-            "sw_version": device_info.get("app_version"),
-        }
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the switch is on."""
-        return self.entity_description.value_fn(self.coordinator.data)
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.entity_description.available_fn(self.coordinator.data)
-        )
+        self._attr_device_info = coordinator.device_info
+        self._update_from_coordinator()
+
+    def _update_from_coordinator(self) -> None:
+        """Cache availability and state from the latest coordinator data."""
+        description = self.entity_description
+        data = self.coordinator.data
+        self._attr_available = description.available_fn(data)
+        self._attr_is_on = description.value_fn(data) if self._attr_available else None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
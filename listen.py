@@ -1,8 +1,13 @@
+import os
+import sys
+
 import socketio
 
+debug = bool(os.environ.get("EMLID_DEBUG"))
+
 sio = socketio.Client(
-    logger=True,
-    engineio_logger=True,
+    logger=debug,
+    engineio_logger=debug,
     reconnection=True,
 )
 
@@ -16,13 +21,12 @@ def disconnect():
 
 @sio.on('*')
 def catch_all(event, data):
-    print(event, data)
+    sys.stdout.write(f"{event} {data}\n")
 
 sio.connect(
     "http://192.168.1.21",
     socketio_path="/socket.io",
-    transports=["polling", "websocket"],
+    transports=["websocket"],
 )
 
 sio.wait()
-